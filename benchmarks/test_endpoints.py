@@ -0,0 +1,67 @@
+"""
+Benchmarks for the signup and unregister endpoints.
+
+Run separately from the functional suite:
+
+    pytest benchmarks
+"""
+
+import urllib.parse
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app, activities
+
+ACTIVITY = "Chess Club"
+EMAIL = "benchmark@mergington.edu"
+ACTIVITY_PATH = f"/activities/{urllib.parse.quote(ACTIVITY)}"
+
+
+def _remove_participant():
+    """Make sure the benchmark email is not signed up."""
+    participants = activities[ACTIVITY]["participants"]
+    if EMAIL in participants:
+        participants.remove(EMAIL)
+
+
+def _add_participant():
+    """Make sure the benchmark email is signed up."""
+    participants = activities[ACTIVITY]["participants"]
+    if EMAIL not in participants:
+        participants.append(EMAIL)
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Provide a test client for the FastAPI application."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def restore_participants():
+    """Restore the benchmarked activity's participant list after the test."""
+    participants = activities[ACTIVITY]["participants"]
+    saved = list(participants)
+    yield
+    participants[:] = saved
+
+
+def test_signup_benchmark(benchmark, client, restore_participants):
+    """Benchmark POST /activities/{activity_name}/signup."""
+    response = benchmark.pedantic(
+        lambda: client.post(f"{ACTIVITY_PATH}/signup?email={EMAIL}"),
+        setup=_remove_participant,
+        rounds=200,
+    )
+    assert response.status_code == 200
+
+
+def test_unregister_benchmark(benchmark, client, restore_participants):
+    """Benchmark DELETE /activities/{activity_name}/participants."""
+    response = benchmark.pedantic(
+        lambda: client.delete(f"{ACTIVITY_PATH}/participants?email={EMAIL}"),
+        setup=_add_participant,
+        rounds=200,
+    )
+    assert response.status_code == 200
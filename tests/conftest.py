@@ -3,7 +3,24 @@ from fastapi.testclient import TestClient
 from src.app import app
 
 
-@pytest.fixture
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run slow tests"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
 def client():
     """Provide a test client for the FastAPI application."""
-    return TestClient(app)
+    with TestClient(app) as c:
+        yield c